@@ -3,15 +3,18 @@
 use anyhow::Result;
 use tracing_subscriber::{layer::SubscriberExt, util::SubscriberInitExt, EnvFilter};
 use tracing_appender;
+use tracing_appender::non_blocking::WorkerGuard;
 
-pub fn init() -> Result<()> {
+/// Initialize logging. Hold the returned guard for the lifetime of the
+/// process - dropping it shuts down the background file writer.
+pub fn init() -> Result<WorkerGuard> {
     // Create logs directory
     let log_dir = crate::config::Config::get_log_dir();
     std::fs::create_dir_all(&log_dir)?;
 
     // Configure file appender
     let file_appender = tracing_appender::rolling::daily(log_dir, "cluely-guard.log");
-    let (non_blocking, _guard) = tracing_appender::non_blocking(file_appender);
+    let (non_blocking, guard) = tracing_appender::non_blocking(file_appender);
 
     // Create filter
     let filter = EnvFilter::try_from_default_env()
@@ -34,5 +37,5 @@ pub fn init() -> Result<()> {
         )
         .init();
 
-    Ok(())
+    Ok(guard)
 }
@@ -23,8 +23,8 @@ use detection::DetectionEngine;
 
 #[tokio::main]
 async fn main() -> Result<()> {
-    // Initialize logging
-    logging::init()?;
+    // Initialize logging (keep the guard so the file writer stays alive)
+    let _log_guard = logging::init()?;
     info!("🚀 Starting CluelyGuard v{}", env!("CARGO_PKG_VERSION"));
 
     // Load configuration